@@ -0,0 +1,58 @@
+"""Config file discovery.
+
+Kept separate from config.py so commands that only need to locate the
+config (to derive the repo directory) don't pay for the PyYAML import
+that loading it requires.
+"""
+
+import os
+from pathlib import Path
+
+
+class ConfigError(Exception):
+    """Raised when config is invalid or not found."""
+    pass
+
+
+def find_config(start_dir: Path | None = None) -> Path:
+    """Find .repoverlay.yaml by searching upward from start_dir.
+
+    If the REPOVERLAY_CONFIG environment variable points at an existing
+    file, it is used directly - one stat instead of a walk up every
+    parent directory. Shell wrappers can export it to skip the search.
+
+    Args:
+        start_dir: Directory to start search from. Defaults to cwd.
+
+    Returns:
+        Path to the config file.
+
+    Raises:
+        ConfigError: If no config file found.
+    """
+    if start_dir is None:
+        env_path = os.environ.get("REPOVERLAY_CONFIG")
+        if env_path:
+            config_path = Path(env_path)
+            if config_path.exists():
+                return config_path
+
+        start_dir = Path.cwd()
+
+    current = start_dir.resolve()
+
+    while True:
+        config_path = current / ".repoverlay.yaml"
+        # One bare stat per level; Path.exists() wraps the same syscall
+        # in extra Python machinery
+        try:
+            os.stat(config_path)
+            return config_path
+        except OSError:
+            pass
+
+        parent = current.parent
+        if parent == current:
+            # Reached filesystem root
+            raise ConfigError("No .repoverlay.yaml found")
+        current = parent
@@ -1,48 +1,37 @@
 """Configuration loading and validation."""
 
+import os
+import pickle
+import sys
+import tempfile
 from pathlib import Path
 from typing import Any
 
-import yaml
+from ._configfind import ConfigError, find_config
 
+__all__ = ["ConfigError", "find_config", "load_config", "validate_config"]
 
-class ConfigError(Exception):
-    """Raised when config is invalid or not found."""
-    pass
 
-
-def find_config(start_dir: Path | None = None) -> Path:
-    """Find .repoverlay.yaml by searching upward from start_dir.
+def _cache_path(config_path: Path) -> Path:
+    """Get path to the parsed-config cache file.
 
     Args:
-        start_dir: Directory to start search from. Defaults to cwd.
+        config_path: Path to the config file.
 
     Returns:
-        Path to the config file.
-
-    Raises:
-        ConfigError: If no config file found.
+        Path to config.cache.pkl under .repoverlay/
     """
-    if start_dir is None:
-        start_dir = Path.cwd()
-
-    current = start_dir.resolve()
-
-    while True:
-        config_path = current / ".repoverlay.yaml"
-        if config_path.exists():
-            return config_path
-
-        parent = current.parent
-        if parent == current:
-            # Reached filesystem root
-            raise ConfigError("No .repoverlay.yaml found")
-        current = parent
+    return config_path.parent / ".repoverlay" / "config.cache.pkl"
 
 
 def load_config(config_path: Path) -> dict[str, Any]:
     """Load and validate config from YAML file.
 
+    The validated dict is cached to .repoverlay/config.cache.pkl keyed
+    by the config file's (mtime_ns, size), so warm invocations replace
+    the YAML parse with a stat and a pickle load. Cache problems of any
+    kind fall back to a fresh parse.
+
     Args:
         config_path: Path to the config file.
 
@@ -53,15 +42,57 @@ def load_config(config_path: Path) -> dict[str, Any]:
         ConfigError: If config is invalid.
     """
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        st = os.stat(config_path)
+        cache_key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        cache_key = None
+
+    cache_file = _cache_path(config_path)
+
+    if cache_key is not None:
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("key") == cache_key:
+                return cached["data"]
+        except Exception:
+            # Missing, stale, or corrupt cache - reparse below
+            pass
+
+    # Deferred so a config-cache hit above never pays the PyYAML import
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it; 5-10x faster
+    # than the pure-Python SafeLoader and equally safe
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    try:
+        # Bytes input lets libyaml do the decoding in C
+        with open(config_path, "rb") as f:
+            config = yaml.load(f, Loader=loader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid config: {e}")
 
     if config is None:
         raise ConfigError("Invalid config: empty file")
 
-    return validate_config(config)
+    validated = validate_config(config)
+
+    # Only cache when .repoverlay/ already exists (clone creates it);
+    # write atomically so a concurrent reader never sees a torn file
+    if cache_key is not None and cache_file.parent.is_dir():
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"key": cache_key, "data": validated}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_name, cache_file)
+        except OSError:
+            pass
+
+    return validated
 
 
 def validate_config(config: dict[str, Any]) -> dict[str, Any]:
@@ -118,6 +149,11 @@ def validate_config(config: dict[str, Any]) -> dict[str, Any]:
             if dst.startswith("/"):
                 raise ConfigError(f"Destination must be relative: {dst}")
 
+            # Interned paths compare by pointer in the dict/set lookups
+            # the sync pipeline does downstream
+            mapping["src"] = sys.intern(mapping["src"])
+            mapping["dst"] = sys.intern(dst)
+
     # Validate sops_config (optional string, relative path)
     if "sops_config" in overlay:
         sops_config = overlay["sops_config"]
@@ -134,5 +170,6 @@ def validate_config(config: dict[str, Any]) -> dict[str, Any]:
         for i, pattern in enumerate(encrypt_patterns):
             if not isinstance(pattern, str):
                 raise ConfigError(f"Invalid encrypt_patterns[{i}]: must be a string")
+            encrypt_patterns[i] = sys.intern(pattern)
 
     return config
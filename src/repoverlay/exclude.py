@@ -1,10 +1,17 @@
 """Git exclude file management for repoverlay."""
 
+import re
 from pathlib import Path
 
 BEGIN_MARKER = "# BEGIN repoverlay managed - do not edit"
 END_MARKER = "# END repoverlay managed"
 
+# Strips the whole managed block in one C-level substitution; markers
+# may carry surrounding blanks, matching the old per-line strip() check
+_MANAGED_RE = re.compile(
+    rf"(?ms)^[ \t]*{re.escape(BEGIN_MARKER)}[ \t]*$.*?^[ \t]*{re.escape(END_MARKER)}[ \t]*(?:\n|\Z)"
+)
+
 
 def get_exclude_path(root_dir: Path) -> Path:
     """Get path to .git/info/exclude file.
@@ -30,25 +37,19 @@ def update_exclude_file(root_dir: Path, symlinks: list[str]) -> None:
     # Ensure directory exists
     exclude_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Read existing content
-    existing_content = ""
-    if exclude_path.exists():
-        existing_content = exclude_path.read_text()
-
-    # Remove existing managed section
-    content_without_managed = _remove_managed_section(existing_content)
-
-    # Build new managed section
-    managed_section = _build_managed_section(symlinks)
-
-    # Combine content
-    new_content = content_without_managed.rstrip()
-    if new_content:
-        new_content += "\n\n"
-    new_content += managed_section
+    # Strip any previous managed block with a single regex substitution;
+    # opening directly avoids a separate exists() stat before the read
+    try:
+        content = exclude_path.read_text()
+    except FileNotFoundError:
+        content = ""
+    unmanaged = _MANAGED_RE.sub("", content).rstrip()
 
-    # Write back
-    exclude_path.write_text(new_content)
+    with open(exclude_path, "w") as f:
+        if unmanaged:
+            f.write(unmanaged)
+            f.write("\n\n")
+        _write_managed_section(f, symlinks)
 
 
 def remove_managed_section(root_dir: Path) -> None:
@@ -59,64 +60,34 @@ def remove_managed_section(root_dir: Path) -> None:
     """
     exclude_path = get_exclude_path(root_dir)
 
-    if not exclude_path.exists():
+    try:
+        content = exclude_path.read_text()
+    except FileNotFoundError:
         return
 
-    existing_content = exclude_path.read_text()
-    new_content = _remove_managed_section(existing_content).rstrip()
-
+    new_content = _MANAGED_RE.sub("", content).rstrip()
     if new_content:
         new_content += "\n"
 
     exclude_path.write_text(new_content)
 
 
-def _remove_managed_section(content: str) -> str:
-    """Remove the managed section from content.
-
-    Args:
-        content: File content
-
-    Returns:
-        Content with managed section removed
-    """
-    lines = content.split("\n")
-    result = []
-    in_managed = False
-
-    for line in lines:
-        if line.strip() == BEGIN_MARKER:
-            in_managed = True
-            continue
-        if line.strip() == END_MARKER:
-            in_managed = False
-            continue
-        if not in_managed:
-            result.append(line)
-
-    return "\n".join(result)
-
-
-def _build_managed_section(symlinks: list[str]) -> str:
-    """Build the managed section content.
+def _write_managed_section(f, symlinks: list[str]) -> None:
+    """Write the managed section to an open file.
 
     Args:
+        f: Writable text file
         symlinks: List of symlink paths to exclude
-
-    Returns:
-        Managed section content
     """
-    lines = [BEGIN_MARKER]
+    f.write(BEGIN_MARKER + "\n")
 
     # Always exclude repoverlay files
-    lines.append(".repoverlay.yaml")
-    lines.append(".repoverlayignore")
-    lines.append(".repoverlay/")
+    f.write(".repoverlay.yaml\n.repoverlayignore\n.repoverlay/\n")
 
     # Add symlinks
-    for symlink in sorted(symlinks):
-        lines.append(symlink)
-
-    lines.append(END_MARKER)
+    ordered = list(symlinks)
+    ordered.sort()
+    for symlink in ordered:
+        f.write(symlink + "\n")
 
-    return "\n".join(lines) + "\n"
+    f.write(END_MARKER + "\n")
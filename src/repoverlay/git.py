@@ -1,5 +1,8 @@
 """Git command wrapper."""
 
+import functools
+import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -9,21 +12,96 @@ class GitError(Exception):
     pass
 
 
-def clone(repo_url: str, target_dir: Path) -> None:
+# Full path to git, resolved once per process
+_GIT = shutil.which("git") or "git"
+
+
+def _spawn(
+    args: list[str],
+    repo_dir: Path | None = None,
+    capture: bool = True,
+    text: bool = True,
+) -> subprocess.CompletedProcess:
+    """Spawn git on CPython's posix_spawn fast path.
+
+    A fully-qualified executable, close_fds=False, and no cwd= argument
+    (the repo is selected with `git -C` instead) are the conditions that
+    let subprocess use posix_spawn rather than fork+exec, skipping both
+    the page-table copy of the interpreter and the close-every-fd loop
+    on each of the many git calls a sync makes.
+
+    Args:
+        args: Git arguments (without the executable)
+        repo_dir: Repository to run in, or None for the cwd
+        capture: Capture output (default) or stream to terminal
+        text: Decode captured output as text (default) or keep bytes
+
+    Returns:
+        CompletedProcess result
+    """
+    cmd = [_GIT]
+    if repo_dir is not None:
+        cmd.append("-C")
+        cmd.append(os.fspath(repo_dir))
+    cmd.extend(args)
+
+    if capture:
+        return subprocess.run(cmd, capture_output=True, text=text, close_fds=False)
+    return subprocess.run(cmd, close_fds=False)
+
+
+@functools.lru_cache(maxsize=1)
+def supports_partial_clone() -> bool:
+    """Whether the installed git accepts --filter on clone (>= 2.27).
+
+    Returns:
+        True if partial clones are supported.
+    """
+    result = _spawn(["--version"])
+    if result.returncode != 0:
+        return False
+    try:
+        major, minor = result.stdout.split()[2].split(".")[:2]
+        return (int(major), int(minor)) >= (2, 27)
+    except (IndexError, ValueError):
+        return False
+
+
+def clone(
+    repo_url: str,
+    target_dir: Path,
+    *,
+    branch: str | None = None,
+    depth: int | None = None,
+    single_branch: bool = False,
+    filter_spec: str | None = None,
+) -> None:
     """Clone a git repository.
 
     Args:
         repo_url: URL or path to the repository.
         target_dir: Directory to clone into.
+        branch: Branch or tag to clone directly.
+        depth: History depth for a shallow clone.
+        single_branch: Fetch only the cloned branch.
+        filter_spec: Partial-clone filter (e.g. "blob:none"); ignored
+            when the installed git predates --filter support.
 
     Raises:
         GitError: If clone fails.
     """
-    result = subprocess.run(
-        ["git", "clone", repo_url, str(target_dir)],
-        capture_output=True,
-        text=True,
-    )
+    args = ["clone"]
+    if depth:
+        args.extend(["--depth", str(depth)])
+    if single_branch:
+        args.append("--single-branch")
+    if branch:
+        args.extend(["--branch", branch])
+    if filter_spec and supports_partial_clone():
+        args.extend(["--filter", filter_spec])
+    args.extend([repo_url, str(target_dir)])
+
+    result = _spawn(args)
 
     if result.returncode != 0:
         raise GitError(f"Clone failed: {result.stderr.strip()}")
@@ -39,12 +117,7 @@ def checkout(repo_dir: Path, ref: str) -> None:
     Raises:
         GitError: If checkout fails.
     """
-    result = subprocess.run(
-        ["git", "checkout", ref],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True,
-    )
+    result = _spawn(["checkout", ref], repo_dir)
 
     if result.returncode != 0:
         raise GitError(f"Checkout failed: {result.stderr.strip()}")
@@ -63,12 +136,7 @@ def get_remote_url(repo_dir: Path, remote: str = "origin") -> str:
     Raises:
         GitError: If command fails.
     """
-    result = subprocess.run(
-        ["git", "remote", "get-url", remote],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True,
-    )
+    result = _spawn(["remote", "get-url", remote], repo_dir)
 
     if result.returncode != 0:
         raise GitError(f"Failed to get remote URL: {result.stderr.strip()}")
@@ -90,22 +158,14 @@ def run_git(repo_dir: Path, args: list[str], capture: bool = False) -> subproces
     Raises:
         GitError: If command fails and capture is True
     """
-    cmd = ["git"] + args
-
     if capture:
-        result = subprocess.run(
-            cmd,
-            cwd=repo_dir,
-            capture_output=True,
-            text=True,
-        )
+        result = _spawn(args, repo_dir)
         if result.returncode != 0:
             raise GitError(result.stderr.strip() or f"Git command failed: {' '.join(args)}")
         return result
     else:
         # Stream output to terminal
-        result = subprocess.run(cmd, cwd=repo_dir)
-        return result
+        return _spawn(args, repo_dir, capture=False)
 
 
 def fetch(repo_dir: Path) -> None:
@@ -265,12 +325,7 @@ def is_bare_repo(repo_dir: Path) -> bool:
     Returns:
         True if the repository is bare, False otherwise.
     """
-    result = subprocess.run(
-        ["git", "rev-parse", "--is-bare-repository"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True,
-    )
+    result = _spawn(["rev-parse", "--is-bare-repository"], repo_dir)
     return result.returncode == 0 and result.stdout.strip() == "true"
 
 
@@ -283,12 +338,7 @@ def get_current_branch(repo_dir: Path) -> str | None:
     Returns:
         Branch name, or None if in detached HEAD state or not a git repo.
     """
-    result = subprocess.run(
-        ["git", "branch", "--show-current"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True,
-    )
+    result = _spawn(["branch", "--show-current"], repo_dir)
     if result.returncode != 0:
         return None
     branch = result.stdout.strip()
@@ -308,45 +358,81 @@ def pull_from(repo_dir: Path, source_repo: Path, branch: str) -> None:
     Raises:
         GitError: If pull fails.
     """
-    result = subprocess.run(
-        ["git", "pull", str(source_repo), branch],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True,
-    )
+    result = _spawn(["pull", str(source_repo), branch], repo_dir)
     if result.returncode != 0:
         raise GitError(f"Pull failed: {result.stderr.strip()}")
 
 
-def has_uncommitted_changes(repo_dir: Path) -> tuple[bool, list[str]]:
-    """Check if there are uncommitted changes (staged or unstaged).
+def get_status_v2(repo_dir: Path) -> tuple[list[str], int | None, int | None]:
+    """Get dirty files and ahead/behind counts in one git invocation.
+
+    A single `git status --porcelain=v2 --branch` replaces the separate
+    status/rev-parse/rev-list processes the individual checks used to
+    spawn; each fork+exec of git costs several milliseconds.
 
     Args:
         repo_dir: Path to the repository.
 
     Returns:
-        Tuple of (has_changes, list of changed files)
+        Tuple of (changed files in "XY path" form, commits ahead of
+        upstream, commits behind). Ahead/behind are None when no
+        upstream is configured.
     """
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True,
-    )
+    # -z gives NUL-terminated records: no text decode of the whole
+    # stream up front, and filenames containing newlines stay intact
+    result = _spawn(["status", "--porcelain=v2", "--branch", "-z"], repo_dir, text=False)
     if result.returncode != 0:
-        return False, []
-
-    output = result.stdout.strip()
-    if not output:
-        return False, []
+        return [], None, None
 
-    # Parse the porcelain output to get file list
     changed_files = []
-    for line in output.split("\n"):
-        if line:
-            # Format is "XY filename" where XY is the status
-            changed_files.append(line)
-    return True, changed_files
+    ahead = None
+    behind = None
+    records = result.stdout.split(b"\x00")
+    index = 0
+    while index < len(records):
+        record = records[index]
+        index += 1
+        if not record:
+            continue
+
+        if record.startswith(b"#"):
+            # Header; "# branch.ab +N -M" carries the upstream counts
+            if record.startswith(b"# branch.ab "):
+                parts = record.split()
+                ahead = int(parts[2])
+                behind = abs(int(parts[3]))
+            continue
+
+        # Entry records; reconstruct the familiar v1 "XY path" form,
+        # decoding only the path actually shown to the user
+        kind = record[0:1]
+        if kind == b"1":
+            xy = record[2:4].decode().replace(".", " ")
+            changed_files.append(f"{xy} {record.split(b' ', 8)[8].decode()}")
+        elif kind == b"2":
+            xy = record[2:4].decode().replace(".", " ")
+            changed_files.append(f"{xy} {record.split(b' ', 9)[9].decode()}")
+            # The rename source follows as its own NUL-terminated record
+            index += 1
+        elif kind == b"u":
+            changed_files.append(f"{record[2:4].decode()} {record.split(b' ', 10)[10].decode()}")
+        elif kind == b"?":
+            changed_files.append(f"?? {record[2:].decode()}")
+
+    return changed_files, ahead, behind
+
+
+def has_uncommitted_changes(repo_dir: Path) -> tuple[bool, list[str]]:
+    """Check if there are uncommitted changes (staged or unstaged).
+
+    Args:
+        repo_dir: Path to the repository.
+
+    Returns:
+        Tuple of (has_changes, list of changed files)
+    """
+    changed_files, _, _ = get_status_v2(repo_dir)
+    return bool(changed_files), changed_files
 
 
 def has_unpushed_commits(repo_dir: Path) -> tuple[bool, int]:
@@ -358,45 +444,52 @@ def has_unpushed_commits(repo_dir: Path) -> tuple[bool, int]:
     Returns:
         Tuple of (has_unpushed, count of unpushed commits)
     """
-    # First check if there's an upstream configured
-    result = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "@{u}"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True,
-    )
+    _, ahead, _ = get_status_v2(repo_dir)
+    if ahead is not None:
+        return ahead > 0, ahead
+    return _count_ahead_of_origin(repo_dir)
 
-    if result.returncode != 0:
-        # No upstream configured, try to use origin/<branch>
-        branch = get_current_branch(repo_dir)
-        if not branch:
-            return False, 0
-
-        # Check if origin/<branch> exists
-        result = subprocess.run(
-            ["git", "rev-parse", "--verify", f"origin/{branch}"],
-            cwd=repo_dir,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            # No remote tracking branch, can't determine
-            return False, 0
 
-        upstream = f"origin/{branch}"
-    else:
-        upstream = result.stdout.strip()
+def _count_ahead_of_origin(repo_dir: Path) -> tuple[bool, int]:
+    """Count commits ahead of origin/<branch> when no upstream is set.
 
-    # Count commits ahead of upstream
-    result = subprocess.run(
-        ["git", "rev-list", "--count", f"{upstream}..HEAD"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True,
-    )
+    Args:
+        repo_dir: Path to the repository.
+
+    Returns:
+        Tuple of (has_unpushed, count of unpushed commits)
+    """
+    branch = get_current_branch(repo_dir)
+    if not branch:
+        return False, 0
+
+    # Count commits ahead of origin/<branch> directly; if that ref does
+    # not exist rev-list fails and we can't determine, so there's no
+    # need for a separate rev-parse --verify process first
+    result = _spawn(["rev-list", "--count", f"origin/{branch}..HEAD"], repo_dir)
 
     if result.returncode != 0:
         return False, 0
 
     count = int(result.stdout.strip())
     return count > 0, count
+
+
+def get_repo_state(repo_dir: Path) -> tuple[tuple[bool, int], tuple[bool, list[str]]]:
+    """Answer the unpushed and uncommitted checks from one status query.
+
+    Call sites that gate on both checks (force clone, unlink) previously
+    ran two full status subprocesses; this shares a single one.
+
+    Args:
+        repo_dir: Path to the repository.
+
+    Returns:
+        Tuple of ((has_unpushed, count), (has_uncommitted, files))
+    """
+    changed_files, ahead, _ = get_status_v2(repo_dir)
+    if ahead is not None:
+        unpushed = (ahead > 0, ahead)
+    else:
+        unpushed = _count_ahead_of_origin(repo_dir)
+    return unpushed, (bool(changed_files), changed_files)
@@ -1,12 +1,19 @@
 """Ignore file handling for .repoverlayignore."""
 
 import fnmatch
+import functools
+import os
+import re
 from pathlib import Path
 
 
 def load_ignore_patterns(root_dir: Path) -> list[str]:
     """Load ignore patterns from .repoverlayignore file.
 
+    Repeated loads of an unchanged file are served from a cache keyed
+    by (path, mtime, size), so only the first call pays the read and
+    parse. Callers treat the returned list as read-only.
+
     Args:
         root_dir: Root directory containing .repoverlayignore
 
@@ -15,19 +22,38 @@ def load_ignore_patterns(root_dir: Path) -> list[str]:
     """
     ignore_path = root_dir / ".repoverlayignore"
 
-    if not ignore_path.exists():
+    try:
+        st = os.stat(ignore_path)
+    except OSError:
         return []
 
-    patterns = []
-    with open(ignore_path) as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines and comments
-            if not line or line.startswith("#"):
-                continue
-            patterns.append(line)
+    return _parse_ignore_file(str(ignore_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_ignore_file(path_str: str, mtime_ns: int, size: int) -> list[str]:
+    """Read and parse an ignore file, cached per (path, mtime, size).
+
+    Args:
+        path_str: Path to the ignore file
+        mtime_ns: File mtime, part of the cache key
+        size: File size, part of the cache key
+
+    Returns:
+        List of glob patterns
+    """
+    try:
+        with open(path_str) as f:
+            text = f.read()
+    except OSError:
+        return []
 
-    return patterns
+    # One C-level pass over the stripped lines, skipping blanks/comments
+    return [
+        stripped
+        for stripped in (line.strip() for line in text.splitlines())
+        if stripped and not stripped.startswith("#")
+    ]
 
 
 def should_ignore(path: str, patterns: list[str]) -> bool:
@@ -40,10 +66,9 @@ def should_ignore(path: str, patterns: list[str]) -> bool:
     Returns:
         True if path matches any pattern
     """
-    for pattern in patterns:
-        if _matches_pattern(path, pattern):
-            return True
-    return False
+    if not patterns:
+        return False
+    return _compiled_matcher(tuple(patterns))(path)
 
 
 def _matches_pattern(path: str, pattern: str) -> bool:
@@ -122,6 +147,61 @@ def _matches_pattern(path: str, pattern: str) -> bool:
     return False
 
 
+def compile_patterns(patterns: list[str]):
+    """Compile glob patterns into a single matcher callable.
+
+    Patterns without ** are merged into one alternation regex so the
+    per-path cost is a single C-level match instead of a Python loop
+    over fnmatch calls. Patterns containing ** keep the multi-placement
+    semantics of _matches_pattern.
+
+    Args:
+        patterns: List of glob patterns
+
+    Returns:
+        Callable taking a path string and returning True if it matches
+        any pattern.
+    """
+    simple = [p for p in patterns if "**" not in p]
+    recursive = [p for p in patterns if "**" in p]
+
+    # Full-path matching for all simple patterns
+    path_regex = re.compile("|".join(fnmatch.translate(p) for p in simple)) if simple else None
+
+    # Patterns without / also match against the filename alone
+    name_patterns = [p for p in simple if "/" not in p]
+    name_regex = re.compile("|".join(fnmatch.translate(p) for p in name_patterns)) if name_patterns else None
+
+    def matcher(path: str) -> bool:
+        if path_regex is not None and path_regex.match(path):
+            return True
+        if name_regex is not None and name_regex.match(path.rsplit("/", 1)[-1]):
+            return True
+        for pattern in recursive:
+            if _matches_pattern(path, pattern):
+                return True
+        return False
+
+    return matcher
+
+
+@functools.lru_cache(maxsize=16)
+def _compiled_matcher(patterns: tuple[str, ...]):
+    """Compiled matcher for a pattern tuple, cached per pattern set.
+
+    should_ignore and filter_mappings are called repeatedly with the
+    same loaded pattern list; caching by tuple means each set is
+    compiled once per process.
+
+    Args:
+        patterns: Tuple of glob patterns
+
+    Returns:
+        Matcher callable from compile_patterns
+    """
+    return compile_patterns(list(patterns))
+
+
 def filter_mappings(
     mappings: list[dict], patterns: list[str]
 ) -> list[dict]:
@@ -134,7 +214,11 @@ def filter_mappings(
     Returns:
         Filtered list of mappings (those not ignored)
     """
-    return [m for m in mappings if not should_ignore(m["src"], patterns)]
+    if not patterns:
+        # Nothing to filter; callers only read the result, so skip the copy
+        return mappings
+    matcher = _compiled_matcher(tuple(patterns))
+    return [m for m in mappings if not matcher(m["src"])]
 
 
 def matches_any_pattern(path: str, patterns: list[str]) -> bool:
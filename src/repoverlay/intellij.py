@@ -1,10 +1,24 @@
 """IntelliJ IDEA integration for VCS root configuration."""
 
+import os
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
 from .output import Output, get_output
 
+# Serialized form of a fresh vcs.xml with both VCS roots. The content
+# is fully deterministic, so first-time setup writes these bytes
+# directly instead of building and serializing an element tree.
+_NEW_VCS_XML = (
+    b"<?xml version='1.0' encoding='UTF-8'?>\n"
+    b'<project version="4">\n'
+    b'  <component name="VcsDirectoryMappings">\n'
+    b'    <mapping directory="$PROJECT_DIR$" vcs="Git" />\n'
+    b'    <mapping directory="$PROJECT_DIR$/.repoverlay/repo" vcs="Git" />\n'
+    b"  </component>\n"
+    b"</project>"
+)
+
 
 def configure_vcs_root(root_dir: Path, *, dry_run: bool = False, output: Output | None = None) -> bool:
     """Add .repoverlay/repo as a VCS root in IntelliJ IDEA.
@@ -39,23 +53,37 @@ def configure_vcs_root(root_dir: Path, *, dry_run: bool = False, output: Output
             output.info(f"{output.dry_run_prefix()} Would create {output.path('.idea/vcs.xml')} with overlay VCS root")
         return True
 
-    if vcs_file.exists():
+    # One open answers both "does it exist" and "what's in it" -
+    # no separate stat, and no race between the two
+    try:
+        data = vcs_file.read_bytes()
+    except FileNotFoundError:
+        data = None
+
+    if data is not None:
+        # Steady state: the mapping is already configured. A substring
+        # scan over the raw bytes answers that without parsing any XML.
+        if b'directory="$PROJECT_DIR$/.repoverlay/repo"' in data and b"VcsDirectoryMappings" in data:
+            output.info("IntelliJ VCS root already configured")
+            return True
+
         # Parse existing vcs.xml
         try:
-            tree = ET.parse(vcs_file)
-            root = tree.getroot()
+            root = ET.fromstring(data)
         except ET.ParseError:
             output.warning("Could not parse .idea/vcs.xml - skipping IntelliJ configuration")
             return False
 
-        # Find or create VcsDirectoryMappings component
-        component = root.find(".//component[@name='VcsDirectoryMappings']")
+        # Find or create VcsDirectoryMappings component; components are
+        # direct children of <project>, so a plain scan avoids the
+        # ElementPath compile a predicate XPath would trigger
+        component = _find_mappings_component(root)
         if component is None:
             component = ET.SubElement(root, "component", name="VcsDirectoryMappings")
 
         # Check if mapping already exists
-        for mapping in component.findall("mapping"):
-            if mapping.get("directory") == overlay_mapping:
+        for mapping in component:
+            if mapping.tag == "mapping" and mapping.get("directory") == overlay_mapping:
                 output.info("IntelliJ VCS root already configured")
                 return True
 
@@ -63,18 +91,11 @@ def configure_vcs_root(root_dir: Path, *, dry_run: bool = False, output: Output
         ET.SubElement(component, "mapping", directory=overlay_mapping, vcs="Git")
 
         # Write back with proper formatting
-        _indent_xml(root)
-        tree.write(vcs_file, encoding="UTF-8", xml_declaration=True)
+        ET.indent(root, space="  ")
+        _write_vcs_xml(vcs_file, ET.tostring(root, encoding="UTF-8", xml_declaration=True))
     else:
-        # Create new vcs.xml
-        root = ET.Element("project", version="4")
-        component = ET.SubElement(root, "component", name="VcsDirectoryMappings")
-        ET.SubElement(component, "mapping", directory="$PROJECT_DIR$", vcs="Git")
-        ET.SubElement(component, "mapping", directory=overlay_mapping, vcs="Git")
-
-        _indent_xml(root)
-        tree = ET.ElementTree(root)
-        tree.write(vcs_file, encoding="UTF-8", xml_declaration=True)
+        # Create new vcs.xml from the frozen template
+        _write_vcs_xml(vcs_file, _NEW_VCS_XML)
 
     output.success("Added .repoverlay/repo as IntelliJ VCS root")
     return True
@@ -97,56 +118,74 @@ def remove_vcs_root(root_dir: Path, *, dry_run: bool = False, output: Output | N
     vcs_file = root_dir / ".idea" / "vcs.xml"
     overlay_mapping = "$PROJECT_DIR$/.repoverlay/repo"
 
-    if not vcs_file.exists():
+    try:
+        data = vcs_file.read_bytes()
+    except FileNotFoundError:
         return False
 
     if dry_run:
         output.info(f"{output.dry_run_prefix()} Would remove overlay VCS root from {output.path('.idea/vcs.xml')}")
         return True
 
+    # No overlay mapping in the raw bytes means nothing to remove -
+    # skip the parse entirely
+    if b'directory="$PROJECT_DIR$/.repoverlay/repo"' not in data:
+        return False
+
     try:
-        tree = ET.parse(vcs_file)
-        root = tree.getroot()
+        root = ET.fromstring(data)
     except ET.ParseError:
         return False
 
-    component = root.find(".//component[@name='VcsDirectoryMappings']")
+    component = _find_mappings_component(root)
     if component is None:
         return False
 
     # Find and remove the overlay mapping
     removed = False
-    for mapping in component.findall("mapping"):
-        if mapping.get("directory") == overlay_mapping:
+    for mapping in list(component):
+        if mapping.tag == "mapping" and mapping.get("directory") == overlay_mapping:
             component.remove(mapping)
             removed = True
             break
 
     if removed:
-        _indent_xml(root)
-        tree.write(vcs_file, encoding="UTF-8", xml_declaration=True)
+        ET.indent(root, space="  ")
+        _write_vcs_xml(vcs_file, ET.tostring(root, encoding="UTF-8", xml_declaration=True))
         output.info("Removed .repoverlay/repo from IntelliJ VCS roots")
 
     return removed
 
 
-def _indent_xml(elem: ET.Element, level: int = 0) -> None:
-    """Add indentation to XML elements for pretty printing.
+def _find_mappings_component(root: ET.Element) -> ET.Element | None:
+    """Find the VcsDirectoryMappings component under the project root.
 
     Args:
-        elem: XML element to indent
-        level: Current indentation level
+        root: Parsed <project> element
+
+    Returns:
+        The component element, or None if absent.
     """
-    indent = "\n" + "  " * level
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = indent + "  "
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = indent
-        for child in elem:
-            _indent_xml(child, level + 1)
-        if not child.tail or not child.tail.strip():
-            child.tail = indent
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = indent
+    for child in root:
+        if child.tag == "component" and child.get("name") == "VcsDirectoryMappings":
+            return child
+    return None
+
+
+def _write_vcs_xml(vcs_file: Path, payload: bytes) -> None:
+    """Write vcs.xml atomically so IntelliJ never sees a torn file.
+
+    The payload lands in a sibling temp file, is flushed to disk once,
+    and is renamed over the target - a crash mid-write leaves the old
+    config intact instead of a truncated one.
+
+    Args:
+        vcs_file: Destination path
+        payload: Serialized XML bytes
+    """
+    tmp = vcs_file.with_suffix(".xml.tmp")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, vcs_file)
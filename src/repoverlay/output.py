@@ -1,10 +1,56 @@
 """Colored output utilities for repoverlay."""
 
+import functools
+import io
 import os
 import sys
+from contextlib import contextmanager
 from typing import TextIO
 
 
+@functools.lru_cache(maxsize=1)
+def _env_allows_color() -> bool:
+    """Whether the environment permits color (NO_COLOR unset).
+
+    Probed once per process; the environment doesn't change under us.
+
+    Returns:
+        True if color is allowed.
+    """
+    return not os.environ.get("NO_COLOR")
+
+
+# isatty answers for the two process-lifetime streams, probed once
+_tty_cache: dict[int, bool] = {}
+
+
+def _stream_isatty(stream: TextIO) -> bool:
+    """Whether the stream is a terminal.
+
+    The answer is cached for sys.stdout/sys.stderr, which live for the
+    whole process; other streams (test buffers, pipes handed in by
+    callers) come and go, so they are probed directly.
+
+    Args:
+        stream: Stream to probe.
+
+    Returns:
+        True if the stream reports being a TTY.
+    """
+    if stream is sys.stdout or stream is sys.stderr:
+        key = 0 if stream is sys.stdout else 1
+        cached = _tty_cache.get(key)
+        if cached is None:
+            cached = hasattr(stream, "isatty") and stream.isatty()
+            _tty_cache[key] = cached
+        return cached
+    return hasattr(stream, "isatty") and stream.isatty()
+
+
+def _noop(*args, **kwargs) -> None:
+    """Replacement for suppressed Output methods in quiet mode."""
+
+
 class Output:
     """Handles colored and formatted output."""
 
@@ -39,6 +85,29 @@ class Output:
         # Determine if color should be used
         self._use_color = self._should_use_color(no_color)
 
+        # Precompute the on/off ANSI pair for each color once; the
+        # per-message methods then build lines with plain concatenation
+        # instead of re-deciding the color branch on every call
+        if self._use_color:
+            self._green = (self.GREEN, self.RESET)
+            self._yellow = (self.YELLOW, self.RESET)
+            self._red = (self.RED, self.RESET)
+            self._bold = (self.BOLD, self.RESET)
+            self._cyan = (self.CYAN, self.RESET)
+        else:
+            self._green = self._yellow = self._red = self._bold = self._cyan = ("", "")
+
+        self._dry_run_str = f"{self._yellow[0]}[dry-run]{self._yellow[1]}"
+        self._created_prefix = f"  {self._green[0]}+{self._green[1]} "
+        self._removed_prefix = f"  {self._red[0]}-{self._red[1]} "
+
+        # In quiet mode the informational methods are swapped out for a
+        # no-op at construction, so call sites don't pay a per-call
+        # quiet check; warning/error still go to err_stream as usual
+        if quiet:
+            self.info = self.success = self.header = _noop
+            self.created = self.removed = _noop
+
     def _should_use_color(self, no_color: bool) -> bool:
         """Determine if colored output should be used.
 
@@ -52,29 +121,12 @@ class Output:
         if no_color:
             return False
 
-        # NO_COLOR environment variable
-        if os.environ.get("NO_COLOR"):
-            return False
-
-        # Check if stdout is a TTY
-        if not hasattr(self.stream, "isatty") or not self.stream.isatty():
+        # NO_COLOR environment variable (cached for the process)
+        if not _env_allows_color():
             return False
 
-        return True
-
-    def _colorize(self, text: str, *codes: str) -> str:
-        """Apply color codes to text.
-
-        Args:
-            text: Text to colorize
-            codes: ANSI codes to apply
-
-        Returns:
-            Colorized text (or plain text if color disabled)
-        """
-        if not self._use_color:
-            return text
-        return f"{''.join(codes)}{text}{self.RESET}"
+        # Check if the stream is a TTY
+        return _stream_isatty(self.stream)
 
     def success(self, message: str) -> None:
         """Print a success message (green).
@@ -82,9 +134,7 @@ class Output:
         Args:
             message: Message to print
         """
-        if self.quiet:
-            return
-        print(self._colorize(message, self.GREEN), file=self.stream)
+        self.stream.write(f"{self._green[0]}{message}{self._green[1]}\n")
 
     def warning(self, message: str) -> None:
         """Print a warning message (yellow).
@@ -92,7 +142,7 @@ class Output:
         Args:
             message: Message to print
         """
-        print(self._colorize(f"Warning: {message}", self.YELLOW), file=self.err_stream)
+        print(f"{self._yellow[0]}Warning: {message}{self._yellow[1]}", file=self.err_stream)
 
     def error(self, message: str) -> None:
         """Print an error message (red).
@@ -100,7 +150,7 @@ class Output:
         Args:
             message: Message to print
         """
-        print(self._colorize(f"Error: {message}", self.RED), file=self.err_stream)
+        print(f"{self._red[0]}Error: {message}{self._red[1]}", file=self.err_stream)
 
     def info(self, message: str) -> None:
         """Print an informational message.
@@ -108,9 +158,7 @@ class Output:
         Args:
             message: Message to print
         """
-        if self.quiet:
-            return
-        print(message, file=self.stream)
+        self.stream.write(message + "\n")
 
     def path(self, path: str) -> str:
         """Format a path with color (cyan).
@@ -121,7 +169,7 @@ class Output:
         Returns:
             Formatted path string
         """
-        return self._colorize(path, self.CYAN)
+        return self._cyan[0] + path + self._cyan[1]
 
     def header(self, text: str) -> None:
         """Print a header (bold).
@@ -129,9 +177,7 @@ class Output:
         Args:
             text: Header text
         """
-        if self.quiet:
-            return
-        print(self._colorize(text, self.BOLD), file=self.stream)
+        self.stream.write(f"{self._bold[0]}{text}{self._bold[1]}\n")
 
     def created(self, path: str) -> None:
         """Print a 'created' message for a path.
@@ -139,9 +185,7 @@ class Output:
         Args:
             path: Path that was created
         """
-        if self.quiet:
-            return
-        print(f"  {self._colorize('+', self.GREEN)} {self.path(path)}", file=self.stream)
+        self.stream.write(f"{self._created_prefix}{self.path(path)}\n")
 
     def removed(self, path: str) -> None:
         """Print a 'removed' message for a path.
@@ -149,9 +193,31 @@ class Output:
         Args:
             path: Path that was removed
         """
-        if self.quiet:
-            return
-        print(f"  {self._colorize('-', self.RED)} {self.path(path)}", file=self.stream)
+        self.stream.write(f"{self._removed_prefix}{self.path(path)}\n")
+
+    @contextmanager
+    def batched(self):
+        """Buffer stream output and deliver it in a single write.
+
+        Loops that emit one created()/removed() line per file otherwise
+        pay a stream write (a syscall on a line-buffered TTY) per line;
+        inside this context the lines accumulate in memory and reach
+        the real stream as one write when the block exits.
+
+        Yields:
+            None
+        """
+        original = self.stream
+        buf = io.StringIO()
+        self.stream = buf
+        try:
+            yield
+        finally:
+            self.stream = original
+            text = buf.getvalue()
+            if text:
+                original.write(text)
+                original.flush()
 
     def dry_run_prefix(self) -> str:
         """Get prefix for dry-run messages.
@@ -159,11 +225,12 @@ class Output:
         Returns:
             Formatted dry-run prefix
         """
-        return self._colorize("[dry-run]", self.YELLOW)
+        return self._dry_run_str
 
 
-# Global default output instance
-_default_output: Output | None = None
+# Global default output instance, constructed at import time so
+# get_output() is a plain attribute read with no None check
+_default_output = Output()
 
 
 def get_output() -> Output:
@@ -172,9 +239,6 @@ def get_output() -> Output:
     Returns:
         Default Output instance
     """
-    global _default_output
-    if _default_output is None:
-        _default_output = Output()
     return _default_output
 
 
@@ -1,7 +1,11 @@
 """Overlay cloning and symlink creation."""
 
+import concurrent.futures
+import functools
 import os
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +19,10 @@ from .validation import ValidationError, validate_mappings
 from .warnings import check_gitignore_conflicts
 
 
+# Whether symlinks can be created relative to an open directory fd
+_SYMLINK_DIR_FD = os.symlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
 class OverlayError(Exception):
     """Raised when overlay operations fail."""
     pass
@@ -58,6 +66,24 @@ def get_decoded_dir(root_dir: Path) -> Path:
     return get_overlay_dir(root_dir) / "decoded"
 
 
+def _is_commit_sha(ref: str) -> bool:
+    """Check if a ref looks like a full commit SHA.
+
+    Args:
+        ref: Branch, tag, or commit ref
+
+    Returns:
+        True if ref is a 40-character hex string
+    """
+    if len(ref) != 40:
+        return False
+    try:
+        int(ref, 16)
+        return True
+    except ValueError:
+        return False
+
+
 def _is_local_path(repo: str) -> bool:
     """Check if repo is a local path rather than a git URL.
 
@@ -74,10 +100,35 @@ def _is_local_path(repo: str) -> bool:
     return True
 
 
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree, delegating big ones to rm -rf.
+
+    shutil.rmtree walks the tree in Python, one unlink per call; for a
+    cloned repo with its .git objects that is thousands of interpreter
+    round trips. /bin/rm does the same walk in C. Falls back to
+    shutil.rmtree if rm is unavailable or fails.
+
+    Args:
+        path: Directory to remove
+    """
+    if sys.platform != "win32":
+        try:
+            subprocess.run(
+                ["rm", "-rf", "--", os.fspath(path)],
+                check=True,
+                capture_output=True,
+            )
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    shutil.rmtree(path)
+
+
 def _generate_mappings_from_repo(
     repo_dir: Path,
     encrypted_files: dict[str, dict[str, str]] | None = None,
     exclude_paths: set[str] | None = None,
+    all_files: list[str] | None = None,
 ) -> list[dict]:
     """Generate mappings from all files in a repository.
 
@@ -88,26 +139,28 @@ def _generate_mappings_from_repo(
         repo_dir: Path to the overlay repository
         encrypted_files: Optional dict of encrypted file metadata from SOPS decryption
         exclude_paths: Optional set of paths to exclude from mappings
+        all_files: Optional prescanned file list from sops.scan_repo_files,
+            avoiding a second walk of the repository
 
     Returns:
         List of mapping dicts with src/dst keys
     """
-    mappings = []
     encrypted_files = encrypted_files or {}
     exclude_paths = exclude_paths or set()
 
-    for path in repo_dir.rglob("*"):
-        # Skip directories (we only link files, not dirs directly)
-        # Also skip .git directory and .config directory (holds .sops.yaml)
-        if path.is_dir():
-            continue
-        rel_path = path.relative_to(repo_dir)
-        if rel_path.parts[0] in (".git", ".config"):
+    if all_files is None:
+        all_files = sops.scan_repo_files(repo_dir)[1]
+
+    mappings = []
+    config_prefix = ".config" + os.sep
+    for path_str in all_files:
+        # Skip the top-level .config directory (holds .sops.yaml); the
+        # walk already pruned .git
+        if path_str == ".config" or path_str.startswith(config_prefix):
             continue
-        path_str = str(rel_path)
 
-        # For encrypted files, don't create mappings - they're handled separately
-        # as symlinks to decoded files
+        # For encrypted files, don't create mappings - they're handled
+        # separately as symlinks to decoded files
         if path_str in encrypted_files or path_str in exclude_paths:
             continue
 
@@ -149,8 +202,10 @@ def clone_overlay(
         if force:
             # Safety checks before removing repo
             if (repo_dir / ".git").exists():
+                # Both checks come from one status subprocess
+                (has_unpushed, commit_count), (has_uncommitted, changed_files) = git.get_repo_state(repo_dir)
+
                 # Check for unpushed commits - hard block
-                has_unpushed, commit_count = git.has_unpushed_commits(repo_dir)
                 if has_unpushed:
                     raise UnpushedCommitsError(
                         f"Cannot force clone - there are {commit_count} unpushed commit(s) in the overlay repo.\n"
@@ -159,7 +214,6 @@ def clone_overlay(
                     )
 
                 # Check for uncommitted changes - hard block
-                has_uncommitted, changed_files = git.has_uncommitted_changes(repo_dir)
                 if has_uncommitted:
                     raise UncommittedChangesError(
                         "Cannot force clone - uncommitted changes detected in overlay repo.\n"
@@ -170,7 +224,7 @@ def clone_overlay(
             if dry_run:
                 output.info(f"{output.dry_run_prefix()} Would remove {output.path(str(repo_dir))}")
             else:
-                shutil.rmtree(repo_dir)
+                _fast_rmtree(repo_dir)
         else:
             raise OverlayError("Already cloned. Remove .repoverlay/ to re-clone or use --force")
 
@@ -226,16 +280,24 @@ def clone_overlay(
             # Plain directory - copy contents
             shutil.copytree(local_path, repo_dir)
     else:
-        # Git URL - clone
+        # Git URL - clone only what the worktree needs: a branch/tag ref
+        # (or the default branch) is fetched shallow and single-branch;
+        # a pinned commit needs history, so fetch it blobless instead
+        ref = overlay_config.get("ref")
         try:
-            git.clone(repo_url, repo_dir)
+            if ref is None:
+                git.clone(repo_url, repo_dir, depth=1, single_branch=True)
+            elif _is_commit_sha(ref):
+                git.clone(repo_url, repo_dir, filter_spec="blob:none")
+            else:
+                git.clone(repo_url, repo_dir, branch=ref, depth=1, single_branch=True)
         except git.GitError as e:
             raise OverlayError(str(e))
 
-        # Checkout ref if specified
-        if "ref" in overlay_config:
+        # Checkout only needed for a pinned commit; --branch covered the rest
+        if ref is not None and _is_commit_sha(ref):
             try:
-                git.checkout(repo_dir, overlay_config["ref"])
+                git.checkout(repo_dir, ref)
             except git.GitError as e:
                 raise OverlayError(str(e))
 
@@ -244,8 +306,8 @@ def clone_overlay(
     encrypted_files: dict[str, dict[str, str]] = {}
     encrypted_symlinks: list[str] = []
 
-    # Scan for encrypted files
-    enc_file_paths = sops.scan_encrypted_files(repo_dir)
+    # Scan for encrypted files (the same walk feeds mapping generation)
+    enc_file_paths, all_repo_files = sops.scan_repo_files(repo_dir)
     if enc_file_paths:
         # Find SOPS config
         sops_config = sops.get_sops_config_path(repo_dir, config)
@@ -255,7 +317,9 @@ def clone_overlay(
         try:
             # Decrypt all encrypted files
             output.info("Decrypting SOPS-encrypted files...")
-            encrypted_files = sops.decrypt_all_files(repo_dir, decoded_dir, sops_config)
+            encrypted_files = sops.decrypt_all_files(
+                repo_dir, decoded_dir, sops_config, encrypted_files=enc_file_paths
+            )
             output.info(f"Decrypted {len(encrypted_files)} file(s)")
         except sops.SopsNotAvailableError as e:
             raise OverlayError(str(e))
@@ -271,7 +335,9 @@ def clone_overlay(
         except ValidationError as e:
             raise OverlayError(str(e))
     else:
-        mappings = _generate_mappings_from_repo(repo_dir, encrypted_files)
+        mappings = _generate_mappings_from_repo(
+            repo_dir, encrypted_files, all_files=all_repo_files
+        )
 
     # Load ignore patterns and filter mappings
     ignore_patterns = load_ignore_patterns(root_dir)
@@ -282,6 +348,7 @@ def clone_overlay(
 
     # Create symlinks for decoded (encrypted) files
     if encrypted_files:
+        dirs_created_set = set(dirs_created)
         for enc_path, metadata in encrypted_files.items():
             decoded_path = metadata["decoded_path"]
             # For encrypted files, dst is the decoded path (without .enc suffix)
@@ -311,7 +378,8 @@ def clone_overlay(
                 for i in range(len(rel_parent.parts)):
                     dir_path = Path(*rel_parent.parts[:i + 1])
                     dir_str = str(dir_path)
-                    if dir_str not in dirs_created:
+                    if dir_str not in dirs_created_set:
+                        dirs_created_set.add(dir_str)
                         dirs_created.append(dir_str)
 
             # Calculate relative symlink path
@@ -378,8 +446,9 @@ def sync_overlay(
     state = read_state(root_dir)
     encrypted_files = state.get("encrypted_files", {})
 
-    # Scan for ALL encrypted files (to exclude from regular mappings)
-    all_enc_files = sops.scan_encrypted_files(repo_dir)
+    # Scan for ALL encrypted files (to exclude from regular mappings);
+    # the same walk feeds mapping generation below
+    all_enc_files, all_repo_files = sops.scan_repo_files(repo_dir)
     all_enc_file_strs = {str(f) for f in all_enc_files}
     new_enc_files = [f for f in all_enc_files if str(f) not in encrypted_files]
 
@@ -395,29 +464,52 @@ def sync_overlay(
                 output.info(f"    - {f}")
             exit_code = 2
         else:
-            # Try to decrypt new encrypted files
+            # Try to decrypt new encrypted files; each is an independent
+            # sops subprocess, so overlap them across a small pool and
+            # report results in the original order
+            work = []
             for enc_path in new_enc_files:
                 enc_path_str = str(enc_path)
                 decoded_name = sops.get_decoded_path(enc_path_str)
-                src = repo_dir / enc_path
-                dst = decoded_dir / decoded_name
+                work.append((
+                    enc_path, enc_path_str, decoded_name,
+                    repo_dir / enc_path, decoded_dir / decoded_name,
+                ))
+
+            futures = None
+            if len(work) > 1:
+                max_workers = min(8, len(work))
+                pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+                futures = [
+                    pool.submit(sops.decrypt_file, src, dst, sops_config)
+                    for _, _, _, src, dst in work
+                ]
 
-                try:
-                    sops.decrypt_file(src, dst, sops_config)
-                    encrypted_files[enc_path_str] = {
-                        "decoded_path": decoded_name,
-                        "symlink_dst": decoded_name,
-                        "last_encrypted_hash": sops.file_hash(src),
-                    }
-                    output.info(f"Decrypted new file: {output.path(decoded_name)}")
-                except sops.SopsDecryptionError as e:
-                    output.warning(f"Cannot decrypt {enc_path}: {e}")
-                    exit_code = 2
-                except sops.SopsError as e:
-                    output.warning(f"Failed to decrypt {enc_path}: {e}")
-                    exit_code = 2
+            try:
+                for i, (enc_path, enc_path_str, decoded_name, src, dst) in enumerate(work):
+                    try:
+                        if futures is not None:
+                            futures[i].result()
+                        else:
+                            sops.decrypt_file(src, dst, sops_config)
+                        encrypted_files[enc_path_str] = {
+                            "decoded_path": decoded_name,
+                            "symlink_dst": decoded_name,
+                            "last_encrypted_hash": sops.file_hash(src),
+                        }
+                        output.info(f"Decrypted new file: {output.path(decoded_name)}")
+                    except sops.SopsDecryptionError as e:
+                        output.warning(f"Cannot decrypt {enc_path}: {e}")
+                        exit_code = 2
+                    except sops.SopsError as e:
+                        output.warning(f"Failed to decrypt {enc_path}: {e}")
+                        exit_code = 2
+            finally:
+                if futures is not None:
+                    pool.shutdown()
 
     # Re-decrypt existing files if encrypted sources changed
+    re_decrypted: list[str] = []
     if encrypted_files:
         sops_config = sops.get_sops_config_path(repo_dir, config)
         try:
@@ -441,7 +533,9 @@ def sync_overlay(
             raise OverlayError(str(e))
     else:
         # Exclude all encrypted files from regular mappings (even if decryption failed)
-        mappings = _generate_mappings_from_repo(repo_dir, encrypted_files, all_enc_file_strs)
+        mappings = _generate_mappings_from_repo(
+            repo_dir, encrypted_files, all_enc_file_strs, all_files=all_repo_files
+        )
 
     # Check repo URL mismatch (only for git repos)
     repo_url = overlay_config["repo"]
@@ -474,30 +568,10 @@ def sync_overlay(
         if symlink_dst:
             new_symlinks.add(symlink_dst)
 
-    # Find symlinks to remove (in old state but not in new config)
-    to_remove = old_symlinks - new_symlinks
-
-    # Find orphaned symlinks (target no longer exists)
-    for dst in list(new_symlinks & old_symlinks):
-        dst_path = root_dir / dst
-        if dst_path.is_symlink() and not dst_path.exists():
-            to_remove.add(dst)
-
-    # Find symlinks to create
-    to_create = []
-    for mapping in mappings:
-        dst = mapping["dst"]
-        dst_path = root_dir / dst
-
-        # Skip if already exists and is correct
-        if dst_path.is_symlink():
-            src_path = repo_dir / mapping["src"]
-            expected_target = os.path.relpath(src_path, dst_path.parent)
-            actual_target = os.readlink(dst_path)
-            if actual_target == expected_target:
-                continue
-
-        to_create.append(mapping)
+    # Plan creations, recreations, and orphan removals in one pass
+    to_create, to_remove = _plan_sync(
+        root_dir, repo_dir, mappings, old_symlinks, new_symlinks
+    )
 
     if dry_run:
         for dst in to_remove:
@@ -519,6 +593,7 @@ def sync_overlay(
     )
 
     # Create symlinks for decoded (encrypted) files that don't have symlinks yet
+    dirs_created_set = set(dirs_created)
     for enc_path_str, metadata in encrypted_files.items():
         decoded_path = metadata.get("decoded_path")
         symlink_dst = metadata.get("symlink_dst", decoded_path)
@@ -563,7 +638,8 @@ def sync_overlay(
             for i in range(len(rel_parent.parts)):
                 dir_path = Path(*rel_parent.parts[:i + 1])
                 dir_str = str(dir_path)
-                if dir_str not in dirs_created:
+                if dir_str not in dirs_created_set:
+                    dirs_created_set.add(dir_str)
                     dirs_created.append(dir_str)
 
         # Create symlink
@@ -575,6 +651,20 @@ def sync_overlay(
     # Merge with existing symlinks that weren't removed
     all_symlinks = list((old_symlinks - to_remove) | set(symlinks_created))
 
+    # Steady-state fast path: nothing was created, removed, decrypted,
+    # or re-decrypted, so the state file and git exclude section are
+    # already exact - skip rewriting them
+    if (
+        not to_remove
+        and not symlinks_created
+        and not dirs_created
+        and not new_enc_files
+        and not re_decrypted
+        and set(all_symlinks) == old_symlinks
+    ):
+        output.success("Sync complete.")
+        return exit_code
+
     # Update state
     old_dirs = state.get("created_directories", [])
     all_dirs = list(set(old_dirs) | set(dirs_created))
@@ -592,6 +682,73 @@ def sync_overlay(
     return exit_code
 
 
+def _plan_sync(
+    root_dir: Path,
+    repo_dir: Path,
+    mappings: list[dict],
+    old_symlinks: set[str],
+    new_symlinks: set[str],
+) -> tuple[list[dict], set[str]]:
+    """Plan the symlink work for a sync in one pass over the mappings.
+
+    Each mapping is classified with a single readlink: a failed readlink
+    (missing path, or not a symlink) or a wrong target puts it in
+    to_create, and a link whose own target is gone is an orphan to
+    remove. Symlinks recorded in state but absent from the new config
+    are also removed.
+
+    Args:
+        root_dir: Root directory of main repo
+        repo_dir: Path to the overlay repository
+        mappings: Mappings the new config wants
+        old_symlinks: Symlink dsts recorded in state
+        new_symlinks: All dsts the new config wants, including decoded
+            file destinations
+
+    Returns:
+        Tuple of (mappings to create, symlink dsts to remove)
+    """
+    to_remove = old_symlinks - new_symlinks
+    to_create: list[dict] = []
+
+    # relpath(repo_dir / src, parent) == join(relpath(repo_dir,
+    # parent), src), so cache the prefix per parent directory
+    rel_prefix_cache: dict[str, str] = {}
+    repo_dir_str = os.fspath(repo_dir)
+    root_dir_str = os.fspath(root_dir)
+    mapping_dsts = set()
+    for mapping in mappings:
+        dst = mapping["dst"]
+        mapping_dsts.add(dst)
+        dst_str = root_dir_str + os.sep + dst
+        try:
+            actual_target = os.readlink(dst_str)
+        except OSError:
+            to_create.append(mapping)
+            continue
+
+        parent_str = os.path.dirname(dst_str)
+        prefix = rel_prefix_cache.get(parent_str)
+        if prefix is None:
+            prefix = os.path.relpath(repo_dir_str, parent_str)
+            rel_prefix_cache[parent_str] = prefix
+        src = mapping["src"]
+        expected_target = src if prefix == "." else prefix + os.sep + src
+        if actual_target != expected_target:
+            to_create.append(mapping)
+        if dst in old_symlinks and not os.path.exists(dst_str):
+            # Dangling link - target no longer exists
+            to_remove.add(dst)
+
+    # Decoded-file dsts have no mapping; check those for orphans too
+    for dst in (new_symlinks - mapping_dsts) & old_symlinks:
+        dst_path = root_dir / dst
+        if dst_path.is_symlink() and not dst_path.exists():
+            to_remove.add(dst)
+
+    return to_create, to_remove
+
+
 def _create_symlinks(
     root_dir: Path,
     repo_dir: Path,
@@ -617,57 +774,157 @@ def _create_symlinks(
     """
     symlinks_created = []
     dirs_created = []
+    dirs_created_set: set[str] = set()
     skipped = []
 
-    for mapping in mappings:
-        src = mapping["src"]
-        dst = mapping["dst"]
+    # Directory listings snapshotted once per parent; the four stat
+    # probes per mapping (src exists, dst exists/is_symlink, parent
+    # exists) become dict lookups against these. The cache is per call
+    # and updated in place as entries are removed or created below.
+    dir_cache: dict[str, dict[str, os.DirEntry] | None] = {}
 
-        src_path = repo_dir / src
-        dst_path = root_dir / dst
+    # relpath from each destination directory back to the overlay repo,
+    # computed once per directory; the per-mapping link target is then
+    # that prefix joined with src instead of a full relpath computation
+    repo_dir_str = os.fspath(repo_dir)
+    rel_prefix_cache: dict[str, str] = {}
 
-        # Verify source exists
-        if not src_path.exists():
-            raise OverlayError(f"Source not found in overlay: {src}")
+    def entries_for(dir_str: str) -> dict[str, os.DirEntry] | None:
+        if dir_str not in dir_cache:
+            dir_cache[dir_str] = _scan_dir_entries(dir_str)
+        return dir_cache[dir_str]
 
-        # Check destination
-        if dst_path.exists() or dst_path.is_symlink():
-            if force:
-                if dst_path.is_symlink():
-                    dst_path.unlink()
-                elif dst_path.is_file():
-                    dst_path.unlink()
+    # Parent directories are opened once and links created relative to
+    # the fd, so the kernel resolves only the link name instead of
+    # re-walking the intermediate components for every symlink
+    dir_fds: dict[str, int] = {}
+
+    try:
+        # One stream write for the whole batch of "+ path" lines
+        with output.batched():
+            for mapping in mappings:
+                src = mapping["src"]
+                dst = mapping["dst"]
+
+                src_path = repo_dir / src
+                dst_path = root_dir / dst
+
+                # Verify source exists (resolving symlinked sources the way
+                # Path.exists() would)
+                src_str = os.fspath(src_path)
+                src_dir, _, src_name = src_str.rpartition(os.sep)
+                src_entries = entries_for(src_dir)
+                src_entry = src_entries.get(src_name) if src_entries else None
+                if src_entry is None or (src_entry.is_symlink() and not os.path.exists(src_str)):
+                    raise OverlayError(f"Source not found in overlay: {src}")
+
+                # Check destination
+                dst_str = os.fspath(dst_path)
+                parent_str, _, dst_name = dst_str.rpartition(os.sep)
+                dst_entries = entries_for(parent_str)
+                dst_entry = dst_entries.get(dst_name) if dst_entries else None
+                if dst_entry is not None:
+                    if force:
+                        if dst_entry.is_symlink():
+                            dst_path.unlink()
+                        elif dst_entry.is_file(follow_symlinks=False):
+                            dst_path.unlink()
+                        else:
+                            shutil.rmtree(dst_path)
+                        del dst_entries[dst_name]
+                    else:
+                        # Skip existing files with a warning instead of erroring
+                        output.warning(f"Skipping {dst} - destination already exists (use --force to overwrite)")
+                        skipped.append(dst)
+                        continue
+
+                # Create parent directories if needed
+                if dst_entries is None:
+                    parent = dst_path.parent
+                    parent.mkdir(parents=True, exist_ok=True)
+                    dir_cache[parent_str] = {}
+                    # Track the directories we created
+                    rel_parent = parent.relative_to(root_dir)
+                    # Track all parent directories in the chain
+                    for i in range(len(rel_parent.parts)):
+                        dir_path = Path(*rel_parent.parts[:i + 1])
+                        dir_str = str(dir_path)
+                        if dir_str not in dirs_created_set:
+                            dirs_created_set.add(dir_str)
+                            dirs_created.append(dir_str)
+
+                # Calculate relative symlink path
+                prefix = rel_prefix_cache.get(parent_str)
+                if prefix is None:
+                    prefix = os.path.relpath(repo_dir_str, parent_str)
+                    rel_prefix_cache[parent_str] = prefix
+                rel_path = src if prefix == "." else prefix + os.sep + src
+
+                # Create symlink
+                if _SYMLINK_DIR_FD:
+                    fd = dir_fds.get(parent_str)
+                    if fd is None:
+                        fd = os.open(parent_str, os.O_RDONLY | os.O_DIRECTORY)
+                        dir_fds[parent_str] = fd
+                    os.symlink(rel_path, dst_name, dir_fd=fd)
                 else:
-                    import shutil
-                    shutil.rmtree(dst_path)
-            else:
-                # Skip existing files with a warning instead of erroring
-                output.warning(f"Skipping {dst} - destination already exists (use --force to overwrite)")
-                skipped.append(dst)
-                continue
+                    dst_path.symlink_to(rel_path)
+                symlinks_created.append(dst)
+                output.created(dst)
 
-        # Create parent directories if needed
-        parent = dst_path.parent
-        if not parent.exists():
-            parent.mkdir(parents=True, exist_ok=True)
-            # Track the directories we created
-            rel_parent = parent.relative_to(root_dir)
-            # Track all parent directories in the chain
-            for i in range(len(rel_parent.parts)):
-                dir_path = Path(*rel_parent.parts[:i + 1])
-                dir_str = str(dir_path)
-                if dir_str not in dirs_created:
-                    dirs_created.append(dir_str)
+    finally:
+        for fd in dir_fds.values():
+            os.close(fd)
 
-        # Calculate relative symlink path
-        rel_path = os.path.relpath(src_path, dst_path.parent)
+    return symlinks_created, dirs_created, skipped
 
-        # Create symlink
-        dst_path.symlink_to(rel_path)
-        symlinks_created.append(dst)
-        output.created(dst)
 
-    return symlinks_created, dirs_created, skipped
+def _scan_dir_entries(dir_str: str) -> dict[str, os.DirEntry] | None:
+    """Snapshot a directory's entries in one scandir pass.
+
+    Args:
+        dir_str: Directory path
+
+    Returns:
+        Mapping of entry name to DirEntry, or None if the directory
+        does not exist.
+    """
+    try:
+        with os.scandir(dir_str) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_url(url: str) -> str:
+    """Normalize a git URL for comparison.
+
+    Cached because the same configured and actual URLs are compared on
+    every sync in a process.
+
+    Args:
+        url: URL or path to normalize
+
+    Returns:
+        Normalized form (scheme and .git suffix stripped, lowercased)
+    """
+    url = url.strip()
+    # Remove trailing .git
+    if url.endswith(".git"):
+        url = url[:-4]
+    # Convert git@ to https://
+    if url.startswith("git@"):
+        # git@github.com:user/repo -> github.com/user/repo
+        url = url[4:].replace(":", "/", 1)
+    # Remove https:// prefix
+    if url.startswith("https://"):
+        url = url[8:]
+    if url.startswith("http://"):
+        url = url[7:]
+    # Remove trailing slash
+    url = url.rstrip("/")
+    return url.lower()
 
 
 def _urls_match(url1: str, url2: str) -> bool:
@@ -682,25 +939,7 @@ def _urls_match(url1: str, url2: str) -> bool:
     Returns:
         True if URLs match
     """
-    def normalize(url: str) -> str:
-        url = url.strip()
-        # Remove trailing .git
-        if url.endswith(".git"):
-            url = url[:-4]
-        # Convert git@ to https://
-        if url.startswith("git@"):
-            # git@github.com:user/repo -> github.com/user/repo
-            url = url[4:].replace(":", "/", 1)
-        # Remove https:// prefix
-        if url.startswith("https://"):
-            url = url[8:]
-        if url.startswith("http://"):
-            url = url[7:]
-        # Remove trailing slash
-        url = url.rstrip("/")
-        return url.lower()
-
-    return normalize(url1) == normalize(url2)
+    return _normalize_url(url1) == _normalize_url(url2)
 
 
 class UncommittedChangesError(OverlayError):
@@ -749,8 +988,10 @@ def unlink_overlay(
 
     # Pre-unlink validation (only if repo exists - handles resumable unlink case)
     if repo_dir.exists() and (repo_dir / ".git").exists():
+        # Both checks come from one status subprocess
+        (has_unpushed, commit_count), (has_uncommitted, changed_files) = git.get_repo_state(repo_dir)
+
         # Check for unpushed commits - hard block
-        has_unpushed, commit_count = git.has_unpushed_commits(repo_dir)
         if has_unpushed:
             raise UnpushedCommitsError(
                 f"Cannot unlink - there are {commit_count} unpushed commit(s) in the overlay repo.\n"
@@ -759,7 +1000,6 @@ def unlink_overlay(
             )
 
         # Check for uncommitted changes - warn unless force
-        has_uncommitted, changed_files = git.has_uncommitted_changes(repo_dir)
         if has_uncommitted and not force and not dry_run:
             raise UncommittedChangesError(
                 "Uncommitted changes detected in overlay repo.",
@@ -780,22 +1020,23 @@ def unlink_overlay(
             output.info(f"{output.dry_run_prefix()} Would remove {output.path('.repoverlay/')}")
         return
 
-    # Remove symlinks
-    for symlink in symlinks:
-        symlink_path = root_dir / symlink
-        if symlink_path.is_symlink():
-            symlink_path.unlink()
-            output.removed(symlink)
-
-    # Remove created directories (only if empty, in reverse order by depth)
-    for dir_path in sorted(created_dirs, key=len, reverse=True):
-        full_path = root_dir / dir_path
-        if full_path.is_dir():
-            try:
-                full_path.rmdir()  # Only removes if empty
-                output.removed(dir_path + "/")
-            except OSError:
-                pass  # Directory not empty, skip
+    # Remove symlinks; batch the per-path output into one stream write
+    with output.batched():
+        for symlink in symlinks:
+            symlink_path = root_dir / symlink
+            if symlink_path.is_symlink():
+                symlink_path.unlink()
+                output.removed(symlink)
+
+        # Remove created directories (only if empty, in reverse order by depth)
+        for dir_path in sorted(created_dirs, key=len, reverse=True):
+            full_path = root_dir / dir_path
+            if full_path.is_dir():
+                try:
+                    full_path.rmdir()  # Only removes if empty
+                    output.removed(dir_path + "/")
+                except OSError:
+                    pass  # Directory not empty, skip
 
     # Update git exclude
     try:
@@ -807,10 +1048,9 @@ def unlink_overlay(
     write_state(root_dir, {"symlinks": [], "created_directories": []})
 
     if remove_repo:
-        import shutil
         overlay_dir = get_overlay_dir(root_dir)
         if overlay_dir.exists():
-            shutil.rmtree(overlay_dir)
+            _fast_rmtree(overlay_dir)
             output.removed(".repoverlay/")
 
     output.success("Unlink complete.")
@@ -1,6 +1,8 @@
 """SOPS encryption/decryption operations for repoverlay."""
 
+import concurrent.futures
 import hashlib
+import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -203,14 +205,21 @@ def encrypt_file(
     src: Path,
     dst: Path,
     sops_config: Path | None = None,
-) -> None:
+) -> str:
     """Encrypt a single file with SOPS.
 
+    The encrypted output is captured from sops stdout and written to dst
+    here, so its hash can be computed from the bytes already in memory
+    instead of reading the file back afterwards.
+
     Args:
         src: Path to plaintext source file
         dst: Path to write encrypted output
         sops_config: Optional path to .sops.yaml
 
+    Returns:
+        Hash of the written file in format "sha256:hexdigest"
+
     Raises:
         SopsNotAvailableError: If SOPS CLI is not installed
         SopsEncryptionError: If encryption fails
@@ -227,7 +236,7 @@ def encrypt_file(
     cmd = ["sops", "--encrypt"]
     if sops_config:
         cmd.extend(["--config", str(sops_config)])
-    cmd.extend(["--output", str(dst), str(src)])
+    cmd.append(str(src))
 
     # Ensure parent directory exists
     dst.parent.mkdir(parents=True, exist_ok=True)
@@ -235,11 +244,10 @@ def encrypt_file(
     result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
     )
 
     if result.returncode != 0:
-        error_msg = result.stderr.strip()
+        error_msg = result.stderr.decode().strip()
         if "no matching creation rules" in error_msg.lower():
             raise SopsEncryptionError(
                 f"Cannot encrypt {src}: no matching creation rules in .sops.yaml.\n"
@@ -247,6 +255,10 @@ def encrypt_file(
             )
         raise SopsEncryptionError(f"Failed to encrypt {src}: {error_msg}")
 
+    encrypted = result.stdout
+    dst.write_bytes(encrypted)
+    return f"sha256:{hashlib.sha256(encrypted).hexdigest()}"
+
 
 def file_hash(path: Path) -> str:
     """Compute SHA256 hash of a file.
@@ -264,6 +276,48 @@ def file_hash(path: Path) -> str:
     return f"sha256:{hasher.hexdigest()}"
 
 
+def scan_repo_files(repo_dir: Path) -> tuple[list[Path], list[str]]:
+    """Walk the repository once, collecting encrypted and all files.
+
+    The encrypted-file scan and mapping generation both need a full
+    listing of the repo; one walk serves both so large overlays are
+    traversed a single time per operation.
+
+    Args:
+        repo_dir: Path to the overlay repository
+
+    Returns:
+        Tuple of (encrypted file paths relative to repo_dir, relative
+        path strings of every file outside .git).
+    """
+    encrypted_files: list[Path] = []
+    all_files: list[str] = []
+
+    # Iterative scandir walk instead of os.walk: DirEntry.is_dir reads
+    # the d_type the kernel already returned, relative paths are built
+    # by concatenation rather than os.path.relpath, and no intermediate
+    # dirnames/filenames lists are assembled per directory
+    stack = [("", os.fspath(repo_dir))]
+    while stack:
+        rel_dir, dir_str = stack.pop()
+        with os.scandir(dir_str) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    # Never descend into the git object store
+                    if rel_dir or name != ".git":
+                        stack.append((rel_dir + name + os.sep, entry.path))
+                elif not entry.is_dir():
+                    # Files and symlinks to files; symlinks to
+                    # directories are skipped, as os.walk did
+                    rel = rel_dir + name
+                    all_files.append(rel)
+                    if name.endswith(ENCRYPTED_EXTENSIONS):
+                        encrypted_files.append(Path(rel))
+
+    return encrypted_files, all_files
+
+
 def scan_encrypted_files(repo_dir: Path) -> list[Path]:
     """Scan repository for SOPS-encrypted files.
 
@@ -273,23 +327,14 @@ def scan_encrypted_files(repo_dir: Path) -> list[Path]:
     Returns:
         List of paths to encrypted files (relative to repo_dir)
     """
-    encrypted_files = []
-    for path in repo_dir.rglob("*"):
-        if path.is_file() and is_encrypted_file(path):
-            # Skip .git directory
-            try:
-                rel_path = path.relative_to(repo_dir)
-                if rel_path.parts[0] != ".git":
-                    encrypted_files.append(rel_path)
-            except ValueError:
-                pass
-    return encrypted_files
+    return scan_repo_files(repo_dir)[0]
 
 
 def decrypt_all_files(
     repo_dir: Path,
     decoded_dir: Path,
     sops_config: Path | None = None,
+    encrypted_files: list[Path] | None = None,
 ) -> dict[str, dict[str, str]]:
     """Decrypt all encrypted files from repo to decoded directory.
 
@@ -297,6 +342,8 @@ def decrypt_all_files(
         repo_dir: Path to the overlay repository
         decoded_dir: Path to directory for decrypted files
         sops_config: Optional path to .sops.yaml
+        encrypted_files: Optional prescanned encrypted paths; scans the
+            repository when not provided
 
     Returns:
         Dict mapping encrypted paths to their metadata:
@@ -310,7 +357,8 @@ def decrypt_all_files(
     Raises:
         SopsError: If any decryption fails (rolls back on error)
     """
-    encrypted_files = scan_encrypted_files(repo_dir)
+    if encrypted_files is None:
+        encrypted_files = scan_encrypted_files(repo_dir)
 
     if not encrypted_files:
         return {}
@@ -324,30 +372,41 @@ def decrypt_all_files(
             "  choco install sops     # Windows"
         )
 
-    result: dict[str, dict[str, str]] = {}
-    decrypted_files: list[Path] = []  # Track for rollback
+    work = []
+    for enc_path in encrypted_files:
+        src = repo_dir / enc_path
+        decoded_name = get_decoded_path(str(enc_path))
+        work.append((str(enc_path), src, decoded_name, decoded_dir / decoded_name))
 
+    # Each decryption is an independent sops subprocess blocked on key
+    # material (KMS/PGP roundtrips), so overlap them like re-encryption
     try:
-        for enc_path in encrypted_files:
-            src = repo_dir / enc_path
-            decoded_name = get_decoded_path(str(enc_path))
-            dst = decoded_dir / decoded_name
-
+        if len(work) > 1:
+            max_workers = min(8, len(work))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(decrypt_file, src, dst, sops_config)
+                    for _, src, _, dst in work
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            _, src, _, dst = work[0]
             decrypt_file(src, dst, sops_config)
-            decrypted_files.append(dst)
-
-            result[str(enc_path)] = {
-                "decoded_path": decoded_name,
-                "last_encrypted_hash": file_hash(src),
-            }
-
     except SopsError:
         # Rollback: remove already decrypted files
-        for f in decrypted_files:
-            if f.exists():
-                f.unlink()
+        for _, _, _, dst in work:
+            if dst.exists():
+                dst.unlink()
         raise
 
+    result: dict[str, dict[str, str]] = {}
+    for enc_path_str, src, decoded_name, _ in work:
+        result[enc_path_str] = {
+            "decoded_path": decoded_name,
+            "last_encrypted_hash": file_hash(src),
+        }
+
     return result
 
 
@@ -427,7 +486,7 @@ def re_encrypt_changed_files(
     Raises:
         SopsEncryptionError: If encryption fails
     """
-    updated = []
+    work = []
 
     for enc_path_str in changed_files:
         metadata = encrypted_state.get(enc_path_str)
@@ -442,11 +501,30 @@ def re_encrypt_changed_files(
             # File was deleted - we don't automatically delete encrypted files
             continue
 
-        encrypt_file(decoded_file, enc_dst, sops_config)
+        work.append((enc_path_str, metadata, decoded_file, enc_dst))
+
+    # Each encryption is an independent sops subprocess, so overlap them;
+    # the fork+exec+crypto latency dominates, not CPU
+    hashes = []
+    if len(work) > 1:
+        max_workers = min(8, len(work))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(encrypt_file, decoded_file, enc_dst, sops_config)
+                for _, _, decoded_file, enc_dst in work
+            ]
+            hashes = [future.result() for future in futures]
+    elif work:
+        _, _, decoded_file, enc_dst = work[0]
+        hashes = [encrypt_file(decoded_file, enc_dst, sops_config)]
+
+    updated = []
+    for (enc_path_str, metadata, _, _), new_hash in zip(work, hashes):
         updated.append(enc_path_str)
 
-        # Update hash in state
-        metadata["last_encrypted_hash"] = file_hash(enc_dst)
+        # Update hash in state with the hash encrypt_file computed while
+        # writing, avoiding a read-back of each encrypted file
+        metadata["last_encrypted_hash"] = new_hash
 
     return updated
 
@@ -64,6 +64,8 @@ def write_state(root_dir: Path, state: dict[str, Any]) -> None:
     # Ensure directory exists
     state_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Serialize to one string first; json.dump would issue hundreds of
+    # small writes through the text wrapper for a large symlink list
+    payload = json.dumps(state, indent=2) + "\n"
     with open(state_path, "w") as f:
-        json.dump(state, f, indent=2)
-        f.write("\n")
+        f.write(payload)
@@ -2,6 +2,7 @@
 
 import pytest
 import yaml
+from unittest.mock import patch
 
 from repoverlay.config import ConfigError, find_config, load_config, validate_config
 
@@ -104,6 +105,72 @@ class TestLoadConfig:
             load_config(config_path)
 
 
+class TestFindConfigEnvVar:
+    """Tests for the REPOVERLAY_CONFIG fast path."""
+
+    def test_env_var_used_when_set(self, tmp_path, monkeypatch):
+        """REPOVERLAY_CONFIG short-circuits the upward search."""
+        config_path = tmp_path / ".repoverlay.yaml"
+        config_path.write_text("version: 1")
+        monkeypatch.setenv("REPOVERLAY_CONFIG", str(config_path))
+        monkeypatch.chdir(tmp_path / "..")
+
+        assert find_config() == config_path
+
+    def test_env_var_ignored_when_missing(self, tmp_path, monkeypatch):
+        """A dangling REPOVERLAY_CONFIG falls back to the walk."""
+        config_path = tmp_path / ".repoverlay.yaml"
+        config_path.write_text("version: 1")
+        monkeypatch.setenv("REPOVERLAY_CONFIG", str(tmp_path / "nope.yaml"))
+        monkeypatch.chdir(tmp_path)
+
+        assert find_config() == config_path
+
+
+class TestConfigCache:
+    """Tests for the parsed-config cache."""
+
+    def test_cache_hit_skips_parse(self, tmp_path, sample_config):
+        """Warm load returns the cached dict without re-parsing."""
+        config_path = tmp_path / ".repoverlay.yaml"
+        config_path.write_text(yaml.dump(sample_config))
+        (tmp_path / ".repoverlay").mkdir()
+
+        first = load_config(config_path)
+        assert (tmp_path / ".repoverlay" / "config.cache.pkl").exists()
+
+        # Second load should hit the cache even if the parser is broken
+        with patch("yaml.load", side_effect=AssertionError("parsed")):
+            second = load_config(config_path)
+        assert second == first
+
+    def test_cache_invalidated_on_change(self, tmp_path, sample_config):
+        """Modifying the config file invalidates the cache."""
+        config_path = tmp_path / ".repoverlay.yaml"
+        config_path.write_text(yaml.dump(sample_config))
+        (tmp_path / ".repoverlay").mkdir()
+
+        load_config(config_path)
+
+        changed = dict(sample_config)
+        changed["overlay"] = dict(sample_config["overlay"], repo="git@example.com:new.git")
+        config_path.write_text(yaml.dump(changed))
+
+        result = load_config(config_path)
+        assert result["overlay"]["repo"] == "git@example.com:new.git"
+
+    def test_corrupt_cache_falls_back(self, tmp_path, sample_config):
+        """Corrupt cache file falls back to a fresh parse."""
+        config_path = tmp_path / ".repoverlay.yaml"
+        config_path.write_text(yaml.dump(sample_config))
+        cache_dir = tmp_path / ".repoverlay"
+        cache_dir.mkdir()
+        (cache_dir / "config.cache.pkl").write_bytes(b"not a pickle")
+
+        result = load_config(config_path)
+        assert result["version"] == 1
+
+
 class TestFindConfig:
     """Tests for find_config function."""
 
@@ -196,6 +196,47 @@ class TestStatus:
         assert result.returncode == 0
 
 
+class TestStatusV2:
+    """Tests for the combined porcelain v2 status query."""
+
+    def test_clean_repo(self, git_repo_with_commit):
+        """Clean repo reports no changed files."""
+        changed, _, _ = git.get_status_v2(git_repo_with_commit)
+        assert changed == []
+
+    def test_modified_and_untracked(self, git_repo_with_commit):
+        """Reports modified and untracked files in XY-path form."""
+        (git_repo_with_commit / "file.txt").write_text("changed")
+        (git_repo_with_commit / "new.txt").write_text("new")
+
+        changed, _, _ = git.get_status_v2(git_repo_with_commit)
+        assert any(line.endswith(" file.txt") for line in changed)
+        assert "?? new.txt" in changed
+
+        has_changes, files = git.has_uncommitted_changes(git_repo_with_commit)
+        assert has_changes
+        assert files == changed
+
+    def test_ahead_count(self, git_repo_with_remote):
+        """Reports commits ahead of the configured upstream."""
+        local, _ = git_repo_with_remote
+        changed, ahead, behind = git.get_status_v2(local)
+        assert (ahead, behind) == (0, 0)
+
+        (local / "file.txt").write_text("more")
+        subprocess.run(["git", "commit", "-am", "second"], cwd=local, check=True, capture_output=True)
+
+        _, ahead, _ = git.get_status_v2(local)
+        assert ahead == 1
+        assert git.has_unpushed_commits(local) == (True, 1)
+
+    def test_no_upstream(self, git_repo_with_commit):
+        """Ahead/behind are None without an upstream."""
+        _, ahead, behind = git.get_status_v2(git_repo_with_commit)
+        assert ahead is None and behind is None
+        assert git.has_unpushed_commits(git_repo_with_commit) == (False, 0)
+
+
 class TestDiff:
     """Tests for git.diff function."""
 
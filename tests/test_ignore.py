@@ -3,6 +3,7 @@
 import pytest
 
 from repoverlay.ignore import (
+    compile_patterns,
     filter_mappings,
     load_ignore_patterns,
     should_ignore,
@@ -122,3 +123,34 @@ class TestFilterMappings:
 
         result = filter_mappings(mappings, patterns)
         assert result == []
+
+
+class TestCompilePatterns:
+    """Tests for compile_patterns function."""
+
+    def test_matches_like_should_ignore(self):
+        """Compiled matcher agrees with should_ignore."""
+        patterns = ["*.txt", "secrets/*", "**/test.yaml", "README.md"]
+        matcher = compile_patterns(patterns)
+
+        paths = [
+            "notes.txt",
+            "secrets/db.yaml",
+            "a/b/test.yaml",
+            "path/to/README.md",
+            "main.py",
+            "secrets.py",
+        ]
+        for path in paths:
+            assert matcher(path) == should_ignore(path, patterns)
+
+    def test_filename_match(self):
+        """Patterns without / match the filename anywhere."""
+        matcher = compile_patterns(["*.enc"])
+        assert matcher("deep/nested/db.yaml.enc")
+        assert not matcher("deep/nested/db.yaml")
+
+    def test_no_patterns(self):
+        """Empty pattern list matches nothing."""
+        matcher = compile_patterns([])
+        assert not matcher("anything.txt")
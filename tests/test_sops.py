@@ -1,5 +1,6 @@
 """Tests for SOPS encryption/decryption module."""
 
+import hashlib
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -284,12 +285,17 @@ class TestEncryptFile:
 
         with patch.object(sops, "is_sops_available", return_value=True):
             with patch("subprocess.run") as mock_run:
-                mock_run.return_value = MagicMock(returncode=0, stderr="")
-                sops.encrypt_file(src, dst)
+                mock_run.return_value = MagicMock(
+                    returncode=0, stderr=b"", stdout=b"encrypted"
+                )
+                result = sops.encrypt_file(src, dst)
 
                 args = mock_run.call_args[0][0]
                 assert "sops" in args
                 assert "--encrypt" in args
+                # Output captured from stdout is written to dst and hashed
+                assert dst.read_bytes() == b"encrypted"
+                assert result == f"sha256:{hashlib.sha256(b'encrypted').hexdigest()}"
 
     def test_encrypt_file_no_matching_rules(self, tmp_path):
         """Raises error when no matching creation rules."""
@@ -301,7 +307,7 @@ class TestEncryptFile:
             with patch("subprocess.run") as mock_run:
                 mock_run.return_value = MagicMock(
                     returncode=1,
-                    stderr="no matching creation rules"
+                    stderr=b"no matching creation rules"
                 )
                 with pytest.raises(sops.SopsEncryptionError) as exc_info:
                     sops.encrypt_file(src, dst)
@@ -416,19 +422,18 @@ class TestReEncryptChangedFiles:
             }
         }
 
-        with patch.object(sops, "encrypt_file") as mock_encrypt:
-            with patch.object(sops, "file_hash", return_value="sha256:new"):
-                updated = sops.re_encrypt_changed_files(
-                    decoded_dir,
-                    repo_dir,
-                    ["config.yaml.enc"],
-                    encrypted_state
-                )
+        with patch.object(sops, "encrypt_file", return_value="sha256:new") as mock_encrypt:
+            updated = sops.re_encrypt_changed_files(
+                decoded_dir,
+                repo_dir,
+                ["config.yaml.enc"],
+                encrypted_state
+            )
 
-                assert "config.yaml.enc" in updated
-                mock_encrypt.assert_called_once()
-                # Check hash was updated
-                assert encrypted_state["config.yaml.enc"]["last_encrypted_hash"] == "sha256:new"
+            assert "config.yaml.enc" in updated
+            mock_encrypt.assert_called_once()
+            # Check hash was updated with encrypt_file's return value
+            assert encrypted_state["config.yaml.enc"]["last_encrypted_hash"] == "sha256:new"
 
     def test_re_encrypt_skips_deleted(self, tmp_path):
         """Skips re-encryption of deleted decoded files."""